@@ -241,39 +241,19 @@ def fetch_articles(
     """Fetch synthetic articles from the backend API via batch endpoints.
 
     Uses GET /batches then GET /batches/{id}/articles to avoid the
-    native JSONB query bug in the articles filter endpoint.
+    native JSONB query bug in the articles filter endpoint. All pages share
+    one session so the backend connection is reused across requests.
     """
     base = backend_url.rstrip("/")
     articles: list[dict[str, Any]] = []
 
-    # 1. Fetch all batches
-    batches: list[dict[str, Any]] = []
-    page = 0
-    while True:
-        resp = requests.get(
-            f"{base}/api/eval/datasets/batches",
-            params={"page": page, "size": page_size},
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        content = data.get("content", [])
-        if not content:
-            break
-        batches.extend(content)
-        page += 1
-        if page >= data.get("totalPages", 1):
-            break
-
-    logger.info("Found %d batches", len(batches))
-
-    # 2. Fetch articles per batch
-    for batch in batches:
-        batch_id = batch["id"]
+    with requests.Session() as session:
+        # 1. Fetch all batches
+        batches: list[dict[str, Any]] = []
         page = 0
         while True:
-            resp = requests.get(
-                f"{base}/api/eval/datasets/batches/{batch_id}/articles",
+            resp = session.get(
+                f"{base}/api/eval/datasets/batches",
                 params={"page": page, "size": page_size},
                 timeout=30,
             )
@@ -282,16 +262,38 @@ def fetch_articles(
             content = data.get("content", [])
             if not content:
                 break
-
-            for article in content:
-                if faithful_only and not article.get("isFaithful", False):
-                    continue
-                articles.append(article)
-
+            batches.extend(content)
             page += 1
             if page >= data.get("totalPages", 1):
                 break
 
+        logger.info("Found %d batches", len(batches))
+
+        # 2. Fetch articles per batch
+        for batch in batches:
+            batch_id = batch["id"]
+            page = 0
+            while True:
+                resp = session.get(
+                    f"{base}/api/eval/datasets/batches/{batch_id}/articles",
+                    params={"page": page, "size": page_size},
+                    timeout=30,
+                )
+                resp.raise_for_status()
+                data = resp.json()
+                content = data.get("content", [])
+                if not content:
+                    break
+
+                for article in content:
+                    if faithful_only and not article.get("isFaithful", False):
+                        continue
+                    articles.append(article)
+
+                page += 1
+                if page >= data.get("totalPages", 1):
+                    break
+
     logger.info("Fetched %d articles total (faithful_only=%s)", len(articles), faithful_only)
     return articles
 
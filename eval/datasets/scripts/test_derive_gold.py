@@ -2,9 +2,12 @@
 Tests for the gold dataset derivation script.
 
 Tests the pure functional core: predicate mapping, span location,
-and entity derivation. No HTTP calls or file I/O needed.
+and entity derivation. No HTTP calls or file I/O needed; article fetching
+is exercised against a mocked requests.Session.
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 import yaml
 from pathlib import Path
@@ -13,6 +16,7 @@ from derive_gold import (
     locate_span,
     derive_entities_from_facts,
     article_to_test_case,
+    fetch_articles,
     SKIP_PREDICATES,
 )
 
@@ -387,3 +391,71 @@ class TestYamlOutput:
         yaml_str = yaml.dump(cases, default_flow_style=False)
         loaded = yaml.safe_load(yaml_str)
         assert len(loaded) == 3
+
+
+# ---------------------------------------------------------------------------
+# Article Fetching
+# ---------------------------------------------------------------------------
+
+
+def _page(content: list[dict], total_pages: int) -> MagicMock:
+    resp = MagicMock()
+    resp.json.return_value = {"content": content, "totalPages": total_pages}
+    return resp
+
+
+class TestFetchArticles:
+    """Tests pagination over batches and per-batch articles."""
+
+    BASE = "http://backend"
+
+    def _responses(self) -> dict[tuple[str, int], MagicMock]:
+        batches_url = f"{self.BASE}/api/eval/datasets/batches"
+        return {
+            (batches_url, 0): _page([{"id": "b1"}], total_pages=2),
+            (batches_url, 1): _page([{"id": "b2"}], total_pages=2),
+            (f"{batches_url}/b1/articles", 0): _page(
+                [{"id": "a1", "isFaithful": True}, {"id": "a2", "isFaithful": False}],
+                total_pages=2,
+            ),
+            (f"{batches_url}/b1/articles", 1): _page(
+                [{"id": "a3", "isFaithful": True}], total_pages=2
+            ),
+            (f"{batches_url}/b2/articles", 0): _page(
+                [{"id": "a4", "isFaithful": True}], total_pages=1
+            ),
+        }
+
+    def _fetch(self, faithful_only: bool) -> tuple[list[dict], MagicMock, MagicMock]:
+        responses = self._responses()
+        session = MagicMock()
+        session.get.side_effect = lambda url, params, timeout: responses[(url, params["page"])]
+        with patch("derive_gold.requests.Session") as session_cls:
+            session_cls.return_value.__enter__.return_value = session
+            articles = fetch_articles(self.BASE + "/", faithful_only=faithful_only, page_size=2)
+        return articles, session_cls, session
+
+    def test_follows_batch_and_article_pages(self):
+        articles, _, session = self._fetch(faithful_only=False)
+        assert [a["id"] for a in articles] == ["a1", "a2", "a3", "a4"]
+        requested = [
+            (c.args[0].rsplit("/datasets/", 1)[1], c.kwargs["params"]["page"])
+            for c in session.get.call_args_list
+        ]
+        assert requested == [
+            ("batches", 0),
+            ("batches", 1),
+            ("batches/b1/articles", 0),
+            ("batches/b1/articles", 1),
+            ("batches/b2/articles", 0),
+        ]
+
+    def test_faithful_only_filters_perturbed(self):
+        articles, _, _ = self._fetch(faithful_only=True)
+        assert [a["id"] for a in articles] == ["a1", "a3", "a4"]
+
+    def test_single_session_used_for_all_requests(self):
+        _, session_cls, session = self._fetch(faithful_only=True)
+        session_cls.assert_called_once_with()
+        assert session.get.call_count == 5
+        session_cls.return_value.__exit__.assert_called_once()